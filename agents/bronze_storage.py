@@ -1,4 +1,7 @@
 import logging
+import threading
+import urllib3
+import zstandard as zstd
 from minio import Minio
 from minio.error import S3Error
 from io import BytesIO
@@ -9,6 +12,21 @@ MINIO_ENDPOINT = "localhost:9000"
 MINIO_ACCESS_KEY = "minioadmin"
 MINIO_SECRET_KEY = "minioadmin"
 MINIO_BUCKET = "estate-mind-bronze"
+ZSTD_LEVEL = 10
+
+# Connections kept per host — above the Bronze upload thread count, so
+# concurrent PUTs never wait for (or discard) a pooled connection.
+MINIO_POOL_MAXSIZE = 64
+
+# ZstdCompressor instances must not be shared across threads, and uploads
+# run from a thread pool — keep one compressor per thread.
+_local = threading.local()
+
+
+def _compressor() -> zstd.ZstdCompressor:
+    if not hasattr(_local, "zctx"):
+        _local.zctx = zstd.ZstdCompressor(level=ZSTD_LEVEL)
+    return _local.zctx
 
 
 class BronzeStorage:
@@ -17,7 +35,7 @@ class BronzeStorage:
 
     Rules (from architecture doc):
     - Never modify. Never delete. Append only.
-    - Path format: YYYY/MM/DD/{url_hash}.html
+    - Path format: YYYY/MM/DD/{url_hash}.html.zst (zstd-compressed HTML)
     - This is your IMMUTABLE AUDIT TRAIL
     - You can re-process it anytime with a better LLM
     """
@@ -34,11 +52,26 @@ class BronzeStorage:
             access_key=access_key,
             secret_key=secret_key,
             secure=False,
+            http_client=self._http_client(),
         )
         self.bucket = bucket
         self._ensure_bucket()
         logger.info(f"BronzeStorage initialized | bucket={bucket}")
 
+    @staticmethod
+    def _http_client() -> urllib3.PoolManager:
+        """Pooled keep-alive HTTP client; retries transient MinIO 5xx errors."""
+        return urllib3.PoolManager(
+            num_pools=8,
+            maxsize=MINIO_POOL_MAXSIZE,
+            timeout=urllib3.Timeout(connect=10, read=300),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.1,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+
     def _ensure_bucket(self):
         """Create bucket if it doesn't exist."""
         try:
@@ -51,19 +84,19 @@ class BronzeStorage:
             logger.error(f"MinIO bucket error: {e}")
             raise
 
-    def store_raw_html(self, minio_key: str, raw_html: str) -> bool:
+    def store_raw_html(self, minio_key: str, raw_html_bytes: bytes) -> bool:
         """
-        Store raw HTML in MinIO Bronze layer.
+        Store raw HTML in MinIO Bronze layer, zstd-compressed.
 
         Args:
-            minio_key: Path like "2026/02/08/a36a0d1e51682613.html"
-            raw_html: The complete raw HTML string
+            minio_key: Path like "2026/02/08/a36a0d1e51682613.html.zst"
+            raw_html_bytes: The complete raw HTML, UTF-8 encoded by the caller
 
         Returns:
             True if stored successfully
         """
         try:
-            data = raw_html.encode("utf-8")
+            data = _compressor().compress(raw_html_bytes)
             stream = BytesIO(data)
 
             self.client.put_object(
@@ -72,9 +105,10 @@ class BronzeStorage:
                 data=stream,
                 length=len(data),
                 content_type="text/html",
+                metadata={"X-Amz-Meta-Encoding": "zstd"},
             )
 
-            logger.info(f"✅ Bronze stored: {minio_key} ({len(data):,} bytes)")
+            logger.info(f"✅ Bronze stored: {minio_key} ({len(raw_html_bytes):,} → {len(data):,} bytes)")
             return True
 
         except S3Error as e:
@@ -82,18 +116,28 @@ class BronzeStorage:
             return False
 
     def get_raw_html(self, minio_key: str) -> str:
-        """Retrieve raw HTML from Bronze layer."""
+        """Retrieve raw HTML from Bronze layer (older `.html` objects are uncompressed)."""
         try:
             response = self.client.get_object(self.bucket, minio_key)
-            html = response.read().decode("utf-8")
-            response.close()
-            response.release_conn()
-            logger.info(f"Retrieved: {minio_key} ({len(html):,} chars)")
-            return html
         except S3Error as e:
             logger.error(f"MinIO get failed: {e}")
             return ""
 
+        try:
+            data = response.read()
+            if minio_key.endswith(".zst"):
+                data = zstd.ZstdDecompressor().decompress(data)
+            html = data.decode("utf-8")
+        except (S3Error, zstd.ZstdError, UnicodeDecodeError) as e:
+            logger.error(f"MinIO get failed for {minio_key}: {e}")
+            return ""
+        finally:
+            response.close()
+            response.release_conn()
+
+        logger.info(f"Retrieved: {minio_key} ({len(html):,} chars)")
+        return html
+
     def list_objects(self, prefix: str = "") -> list:
         """List all objects in Bronze layer (or by date prefix)."""
         objects = []
@@ -0,0 +1,60 @@
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+CRAWL_JOURNAL_PATH = os.path.join(os.path.dirname(__file__), "..", "crawl_journal.sqlite3")
+
+# SQLite caps bound parameters per statement
+_CHUNK = 500
+
+
+class CrawlJournal:
+    """
+    Per-URL progress log for crawler runs, stored in SQLite.
+
+    A URL is recorded once its listing is persisted (Bronze + DB), so a run
+    that crashes half-way can be restarted and skip finished URLs with a
+    local lookup instead of a re-fetch.
+    """
+
+    def __init__(self, path=CRAWL_JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS crawl_journal ("
+            " url TEXT PRIMARY KEY,"
+            " crawled_at TEXT NOT NULL,"
+            " status TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info(f"CrawlJournal initialized | path={path}")
+
+    def done(self, urls: list) -> set:
+        """The subset of `urls` already recorded as saved."""
+        urls = list(urls)
+        found = set()
+        with self._lock:
+            for i in range(0, len(urls), _CHUNK):
+                chunk = urls[i:i + _CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT url FROM crawl_journal WHERE status = 'saved' AND url IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+
+    def record(self, urls: list, status: str = "saved"):
+        """Mark URLs as processed; the first record for a URL wins."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO crawl_journal (url, crawled_at, status) VALUES (?, ?, ?)",
+                [(url, now, status) for url in urls],
+            )
+            self._conn.commit()
@@ -1,16 +1,89 @@
 import asyncio
-import json
-import hashlib
+import orjson
 import logging
 import re
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 import litellm
+import xxhash
+
+from agents.extractors import extract_fields, needs_llm
+from agents.llm_cache import LLMCache
+
+try:
+    import hyperscan
+except ImportError:  # optional — falls back to the compiled `re` patterns
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
 LLM_MODEL = "ollama/qwen3:8b"
 OLLAMA_API_BASE = "http://localhost:11434"
+CRAWL_CONCURRENCY = 16
+LLM_CONCURRENCY = 4  # matches Ollama's parallel request slots
+
+# Hostname (without "www.") → source name stored on Listing
+_SOURCE_MAP = {
+    "tayara.tn": "tayara",
+    "mubawab.tn": "mubawab",
+    "tunisie-annonce.com": "tunisie_annonce",
+    "affare.tn": "affare",
+}
+
+# Listing URL patterns for known Tunisian sites
+TAYARA_RE = re.compile(r'https?://(?:www\.)?tayara\.tn/item/[^"\s<>\']+', re.IGNORECASE)
+MUBAWAB_RE = re.compile(r'https?://(?:www\.)?mubawab\.tn/fr/[^"\s<>\']*\d+\.htm', re.IGNORECASE)
+TA_RE = re.compile(r'https?://(?:www\.)?tunisie-annonce\.com/AnnsDetail[^"\s<>\']+', re.IGNORECASE)
+
+# All of the above as one alternation, so the HTML is scanned once instead of three times
+_LISTING_RE = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in (TAYARA_RE, MUBAWAB_RE, TA_RE)),
+    re.IGNORECASE,
+)
+
+
+def _build_hyperscan_db():
+    """Compile all listing patterns into one Hyperscan DFA (None if unavailable)."""
+    if hyperscan is None:
+        return None
+    patterns = (TAYARA_RE, MUBAWAB_RE, TA_RE)
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.pattern.encode() for p in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns),
+    )
+    return db
+
+
+_HS_DB = _build_hyperscan_db()
+
+
+def _scan_listing_urls(html: str):
+    """Yield listing URLs found in raw HTML — Hyperscan if installed, else `_LISTING_RE`."""
+    if _HS_DB is None:
+        for match in _LISTING_RE.finditer(html):
+            yield match.group(0)
+        return
+
+    # Hyperscan reports every match end; keep the longest span per start
+    # to reproduce the greedy `re` semantics.
+    spans = {}
+
+    def on_match(_id, start, end, _flags, _context):
+        if end > spans.get(start, -1):
+            spans[start] = end
+
+    data = html.encode("utf-8")
+    _HS_DB.scan(data, match_event_handler=on_match)
+
+    last_end = -1
+    for start in sorted(spans):
+        if start >= last_end:  # `re` matches never overlap
+            last_end = spans[start]
+            yield data[start:last_end].decode("utf-8", "ignore")
 
 
 class CrawlerAgent:
@@ -21,56 +94,105 @@ class CrawlerAgent:
     1. Crawl4AI fetches search pages (with pagination)
     2. Extract listing URLs using BOTH regex + LLM (hybrid approach)
     3. For each listing: Crawl4AI fetches → returns markdown
-    4. Raw HTML stored in MinIO (Bronze), markdown sent to Extractor
+    4. Known sites: key fields read straight from the DOM (agents.extractors)
+    5. Raw HTML stored in MinIO (Bronze), markdown sent to Extractor
+       only when the DOM pass left key fields empty (`needs_llm`)
     """
 
-    def __init__(self, model=LLM_MODEL, api_base=OLLAMA_API_BASE):
+    def __init__(
+        self,
+        model=LLM_MODEL,
+        api_base=OLLAMA_API_BASE,
+        concurrency=CRAWL_CONCURRENCY,
+        llm_concurrency=LLM_CONCURRENCY,
+        use_cache=True,
+    ):
         self.model = model
         self.api_base = api_base
-        logger.info(f"CrawlerAgent initialized | model={model}")
-
-    async def _crawl_page(self, url: str) -> dict:
-        """Fetch a page using Crawl4AI — returns markdown + raw HTML."""
-        browser_config = BrowserConfig(headless=True)
-        run_config = CrawlerRunConfig()
-
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            result = await crawler.arun(url=url, config=run_config)
-
-            if not result.success:
-                logger.error(f"Crawl4AI failed for {url}: {result.error_message}")
-                return {"markdown": "", "html": "", "links": [], "success": False}
-
-            # Extract all links from the page
-            internal_links = []
-            if result.links:
-                internal_links = [
-                    link.get("href", "")
-                    for link in result.links.get("internal", [])
-                    if link.get("href")
-                ]
-
-            return {
-                "markdown": result.markdown or "",
-                "html": result.html or "",
-                "links": internal_links,
-                "success": True,
-            }
+        self.concurrency = concurrency
+        self.llm_concurrency = llm_concurrency
+        self.cache = LLMCache() if use_cache else None
+        self._llm_sem = None
+        self._llm_sem_loop = None
+        logger.info(f"CrawlerAgent initialized | model={model} | concurrency={concurrency}")
+
+    def _open_crawler(self) -> AsyncWebCrawler:
+        """One headless browser, meant to be shared by every page of a run."""
+        return AsyncWebCrawler(config=BrowserConfig(headless=True))
+
+    async def _crawl_page(self, crawler: AsyncWebCrawler, url: str) -> dict:
+        """Fetch a page using an open Crawl4AI crawler — returns markdown + raw HTML."""
+        result = await crawler.arun(url=url, config=CrawlerRunConfig())
+
+        if not result.success:
+            logger.error(f"Crawl4AI failed for {url}: {result.error_message}")
+            return {"markdown": "", "html": "", "links": [], "success": False}
+
+        # Extract all links from the page
+        internal_links = []
+        if result.links:
+            internal_links = [
+                link.get("href", "")
+                for link in result.links.get("internal", [])
+                if link.get("href")
+            ]
+
+        return {
+            "markdown": result.markdown or "",
+            "html": result.html or "",
+            "links": internal_links,
+            "success": True,
+        }
+
+    def _llm_kwargs(self, prompt: str) -> dict:
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "api_base": self.api_base,
+            "temperature": 0,
+            "max_tokens": 4096,
+        }
+
+    def _cached_llm(self, prompt: str):
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self.model, prompt)
+        if cached is not None:
+            logger.info("  LLM cache hit")
+        return cached
 
     def _call_llm(self, prompt: str) -> str:
-        """Call Qwen3 8B via LiteLLM."""
-        try:
-            response = litellm.completion(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                api_base=self.api_base,
-                temperature=0,
-                max_tokens=4096,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            logger.error(f"LLM call failed: {e}")
-            return ""
+        """Blocking wrapper around `_acall_llm`, for callers outside an event loop."""
+        return asyncio.run(self._acall_llm(prompt))
+
+    def _llm_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight LLM calls, recreated for each event loop."""
+        loop = asyncio.get_running_loop()
+        if self._llm_sem_loop is not loop:
+            self._llm_sem = asyncio.Semaphore(self.llm_concurrency)
+            self._llm_sem_loop = loop
+        return self._llm_sem
+
+    async def _acall_llm(self, prompt: str) -> str:
+        """
+        Call Qwen3 8B via LiteLLM (answers are cached per model + prompt).
+        Awaitable, so it doesn't block concurrent page fetches.
+        """
+        cached = self._cached_llm(prompt)
+        if cached is not None:
+            return cached
+
+        async with self._llm_semaphore():
+            try:
+                response = await litellm.acompletion(**self._llm_kwargs(prompt))
+                content = response.choices[0].message.content
+            except Exception as e:
+                logger.error(f"LLM call failed: {e}")
+                return ""
+
+        if self.cache is not None:
+            self.cache.set(self.model, prompt, content)
+        return content
 
     def _parse_json(self, text: str) -> dict:
         """Extract JSON from LLM response."""
@@ -78,8 +200,8 @@ class CrawlerAgent:
         if "<think>" in text:
             text = text.split("</think>")[-1].strip()
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             pass
         if "```json" in text:
             text = text.split("```json")[1].split("```")[0].strip()
@@ -90,8 +212,8 @@ class CrawlerAgent:
             end = text.rindex("}") + 1
             text = text[start:end]
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             return {}
 
     def _extract_urls_regex(self, html: str, links: list, base_url: str) -> list:
@@ -99,92 +221,74 @@ class CrawlerAgent:
         Fast regex extraction of listing URLs — no LLM needed.
         Works for known Tunisian sites.
         """
-        listing_urls = set()
+        seen = set()
 
-        # Pattern for Tayara listing URLs
-        tayara_pattern = re.compile(
-            r'https?://(?:www\.)?tayara\.tn/item/[^"\s<>\']+',
-            re.IGNORECASE
-        )
-
-        # Pattern for Mubawab listing URLs
-        mubawab_pattern = re.compile(
-            r'https?://(?:www\.)?mubawab\.tn/fr/[^"\s<>\']*\d+\.htm',
-            re.IGNORECASE
-        )
+        # Search in HTML — one streaming pass, query params dropped as we go
+        for url in _scan_listing_urls(html):
+            seen.add(url.split("?", 1)[0])
 
-        # Pattern for Tunisie Annonce
-        ta_pattern = re.compile(
-            r'https?://(?:www\.)?tunisie-annonce\.com/AnnsDetail[^"\s<>\']+',
-            re.IGNORECASE
-        )
-
-        # Search in HTML
-        for pattern in [tayara_pattern, mubawab_pattern, ta_pattern]:
-            listing_urls.update(pattern.findall(html))
-
-        # Search in extracted links
+        # Search in extracted links, with the same patterns
         for link in links:
-            if "/item/" in link and "tayara" in link:
-                listing_urls.add(link)
-            elif "mubawab" in link and ".htm" in link:
-                listing_urls.add(link)
-            elif "tunisie-annonce" in link and "AnnDetail" in link:
-                listing_urls.add(link)
-
-        # Ensure full URLs
-        clean_urls = set()
-        for url in listing_urls:
-            if url.startswith("http"):
-                clean_urls.add(url.split("?")[0])  # Remove query params
-            elif url.startswith("/"):
-                clean_urls.add(base_url + url)
-
-        return list(clean_urls)
+            if link.startswith("/"):
+                link = base_url + link
+            if _LISTING_RE.match(link):
+                seen.add(link.split("?", 1)[0])
+
+        return list(seen)
 
     def _generate_minio_key(self, url: str) -> str:
-        """Generate MinIO object key: YYYY/MM/DD/{url_hash}.html"""
+        """Generate MinIO object key: YYYY/MM/DD/{url_hash}.html.zst"""
         now = datetime.now(timezone.utc)
-        url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
-        return f"{now.strftime('%Y/%m/%d')}/{url_hash}.html"
-
-    def _get_pagination_urls(self, base_search_url: str, max_pages: int) -> list:
-        """Generate paginated search URLs for known sites."""
-        urls = []
+        url_hash = xxhash.xxh3_64_hexdigest(url.encode())  # 16 hex chars, non-cryptographic
+        return f"{now.strftime('%Y/%m/%d')}/{url_hash}.html.zst"
 
+    def _get_pagination_urls(self, base_search_url: str, max_pages: int):
+        """Yield paginated search URLs for known sites, lazily."""
         if "tayara.tn" in base_search_url:
-            for page in range(1, max_pages + 1):
-                sep = "&" if "?" in base_search_url else "?"
-                urls.append(f"{base_search_url}{sep}page={page}")
-
+            sep = "&" if "?" in base_search_url else "?"
+            prefix = f"{base_search_url}{sep}page="
         elif "mubawab.tn" in base_search_url:
-            for page in range(1, max_pages + 1):
-                urls.append(f"{base_search_url}:p:{page}")
-
+            prefix = f"{base_search_url}:p:"
         elif "tunisie-annonce" in base_search_url:
-            for page in range(1, max_pages + 1):
-                urls.append(f"{base_search_url}&page={page}")
-
+            prefix = f"{base_search_url}&page="
         else:
-            urls.append(base_search_url)
+            yield base_search_url
+            return
 
-        return urls
+        for page in range(1, max_pages + 1):
+            yield f"{prefix}{page}"
 
     def discover_listings(self, search_url: str, max_pages: int = 5) -> list:
         """
         Discover listing URLs across multiple search result pages.
         Uses HYBRID approach: regex first (fast), LLM as fallback.
         """
+        async def _discover():
+            async with self._open_crawler() as crawler:
+                return await self._discover_listings(crawler, search_url, max_pages)
+
+        return asyncio.run(_discover())
+
+    async def _discover_listings(
+        self,
+        crawler: AsyncWebCrawler,
+        search_url: str,
+        max_pages: int,
+        max_listings: int = None,
+    ) -> list:
+        """
+        Paginate search results sequentially — each page decides whether to go on.
+        Stops early once `max_listings` URLs are known.
+        """
         logger.info(f"=== Discovering listings | max_pages={max_pages} ===")
 
         all_urls = set()
-        page_urls = self._get_pagination_urls(search_url, max_pages)
         base_url = "/".join(search_url.split("/")[:3])
 
-        for i, page_url in enumerate(page_urls):
-            logger.info(f"[Page {i + 1}/{len(page_urls)}] {page_url}")
+        for i, page_url in enumerate(self._get_pagination_urls(search_url, max_pages)):
+            logger.info(f"[Page {i + 1}/{max_pages}] {page_url}")
 
-            crawl_result = asyncio.run(self._crawl_page(page_url))
+            crawl_result = await self._crawl_page(crawler, page_url)
 
             if not crawl_result["success"]:
                 logger.warning(f"  Failed to crawl page {i + 1}")
@@ -202,7 +306,7 @@ class CrawlerAgent:
             # Method 2: LLM fallback (only if regex found nothing)
             if not regex_urls:
                 logger.info("  Regex found nothing → asking LLM...")
-                llm_urls = self._discover_with_llm(
+                llm_urls = await self._discover_with_llm(
                     crawl_result["markdown"], base_url
                 )
                 logger.info(f"  LLM found: {len(llm_urls)} URLs")
@@ -213,10 +317,14 @@ class CrawlerAgent:
                 logger.info("  No more listings found, stopping pagination")
                 break
 
+            if max_listings is not None and len(all_urls) >= max_listings:
+                logger.info(f"  Reached {max_listings} listings, stopping pagination")
+                break
+
         logger.info(f"=== Total unique URLs discovered: {len(all_urls)} ===")
         return list(all_urls)
 
-    def _discover_with_llm(self, markdown: str, base_url: str) -> list:
+    async def _discover_with_llm(self, markdown: str, base_url: str) -> list:
         """Fallback: use LLM to find listing URLs when regex fails."""
         from agents.prompts.listing_extraction import DISCOVER_LINKS_PROMPT
 
@@ -224,26 +332,39 @@ class CrawlerAgent:
             markdown=markdown[:6000],
             base_url=base_url,
         )
-        llm_response = self._call_llm(prompt)
+        llm_response = await self._acall_llm(prompt)
         result = self._parse_json(llm_response)
         return result.get("listing_urls", [])
 
     def crawl_listing(self, listing_url: str) -> dict:
         """Crawl a single listing page → markdown + raw HTML."""
+        async def _crawl():
+            async with self._open_crawler() as crawler:
+                return await self._crawl_listing(crawler, listing_url)
+
+        return asyncio.run(_crawl())
+
+    async def _crawl_listing(self, crawler: AsyncWebCrawler, listing_url: str) -> dict:
         logger.info(f"Crawling: {listing_url}")
 
-        crawl_result = asyncio.run(self._crawl_page(listing_url))
+        crawl_result = await self._crawl_page(crawler, listing_url)
 
         if not crawl_result["success"]:
             return {"url": listing_url, "success": False, "error": "Crawl failed"}
 
+        # Cheap DOM pass for known sites — the LLM only needs what's left
+        source = self._get_source_name(listing_url)
+        extracted = extract_fields(source, crawl_result["html"])
+
         return {
             "url": listing_url,
             "success": True,
             "markdown": crawl_result["markdown"],
-            "raw_html": crawl_result["html"],
+            "raw_html": crawl_result["html"].encode("utf-8"),  # encoded once, uploaded as-is
             "raw_html_key": self._generate_minio_key(listing_url),
-            "source": self._get_source_name(listing_url),
+            "source": source,
+            "extracted": extracted,
+            "needs_llm": needs_llm(extracted),
             "crawled_at": datetime.now(timezone.utc).isoformat(),
         }
 
@@ -251,44 +372,91 @@ class CrawlerAgent:
         """
         Full crawler pipeline:
         1. Crawl search pages (with pagination) → discover URLs
-        2. For each URL: Crawl4AI fetches → returns markdown + HTML
+        2. Crawl4AI fetches all listings concurrently → returns markdown + HTML
+
+        A single event loop and browser are reused for the whole run.
+        """
+        return asyncio.run(self.run_async(search_url, max_pages, max_listings))
+
+    async def run_async(
+        self, search_url: str, max_pages: int = 100, max_listings: int = 1000, skip=None
+    ) -> list:
+        return [r async for r in self.run_stream(search_url, max_pages, max_listings, skip)]
+
+    async def run_stream(
+        self, search_url: str, max_pages: int = 100, max_listings: int = 1000, skip=None
+    ):
+        """
+        Async generator version of `run` — yields each successful listing as
+        soon as it's crawled, so callers can persist it and drop the HTML.
+        At most `concurrency` finished results wait to be consumed.
+
+        `skip` is an optional async callable: given the discovered URLs, it
+        returns those already processed by an earlier run, which are not
+        fetched again.
         """
         logger.info(f"=== Crawler Agent Starting ===")
         logger.info(f"  Search URL:   {search_url}")
         logger.info(f"  Max pages:    {max_pages}")
         logger.info(f"  Max listings: {max_listings}")
+        logger.info(f"  Concurrency:  {self.concurrency}")
 
-        # Step 1: Discover all listing URLs (paginated)
-        listing_urls = self.discover_listings(search_url, max_pages=max_pages)
-
-        if not listing_urls:
-            logger.warning("No listing URLs discovered")
-            return []
-
-        logger.info(f"Will crawl {min(len(listing_urls), max_listings)} of {len(listing_urls)} URLs")
-
-        # Step 2: Crawl each listing
-        results = []
-        for i, url in enumerate(listing_urls[:max_listings]):
-            logger.info(f"[{i + 1}/{min(len(listing_urls), max_listings)}] {url}")
-            result = self.crawl_listing(url)
-
-            if result["success"]:
-                results.append(result)
-            else:
-                logger.warning(f"  ❌ Failed: {result.get('error')}")
+        async with self._open_crawler() as crawler:
+            # Step 1: Discover all listing URLs (paginated)
+            listing_urls = await self._discover_listings(
+                crawler, search_url, max_pages, max_listings
+            )
 
-        logger.info(f"=== Crawler Done | {len(results)}/{len(listing_urls)} succeeded ===")
-        return results
+            if not listing_urls:
+                logger.warning("No listing URLs discovered")
+                return
+
+            if skip is not None:
+                already_done = await skip(listing_urls)
+                if already_done:
+                    logger.info(f"Resuming: skipping {len(already_done)} already processed URLs")
+                    listing_urls = [u for u in listing_urls if u not in already_done]
+
+            urls = listing_urls[:max_listings]
+            logger.info(f"Will crawl {len(urls)} of {len(listing_urls)} URLs")
+
+            # Step 2: Crawl listings with a fixed pool of workers
+            pending = iter(urls)
+            done = asyncio.Queue(maxsize=self.concurrency)
+
+            async def worker():
+                for url in pending:
+                    await done.put(await self._crawl_one(crawler, url))
+
+            workers = [
+                asyncio.create_task(worker())
+                for _ in range(min(self.concurrency, len(urls)))
+            ]
+            succeeded = 0
+            try:
+                for _ in range(len(urls)):
+                    result = await done.get()
+                    if result["success"]:
+                        succeeded += 1
+                        yield result
+                    else:
+                        logger.warning(f"  ❌ Failed: {result['url']} — {result.get('error')}")
+            finally:
+                for w in workers:
+                    w.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.info(f"=== Crawler Done | {succeeded}/{len(urls)} succeeded ===")
+
+    async def _crawl_one(self, crawler: AsyncWebCrawler, url: str) -> dict:
+        """Crawl one listing; never raises."""
+        try:
+            return await self._crawl_listing(crawler, url)
+        except Exception as e:
+            logger.error(f"Crawl failed for {url}: {e}")
+            return {"url": url, "success": False, "error": str(e)}
 
     def _get_source_name(self, url: str) -> str:
-        domain = url.split("/")[2].lower()
-        if "tayara" in domain:
-            return "tayara"
-        elif "mubawab" in domain:
-            return "mubawab"
-        elif "tunisie-annonce" in domain:
-            return "tunisie_annonce"
-        elif "affare" in domain:
-            return "affare"
-        return domain
\ No newline at end of file
+        host = urlsplit(url).hostname or ""
+        host = host[4:] if host.startswith("www.") else host
+        return _SOURCE_MAP.get(host, host)
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+DOM extractors for known listing sites.
+
+They read price / rooms / area / location straight from the raw HTML, so
+the LLM only has to fill in what the page structure didn't give us.
+"""
+import logging
+
+from agents.extractors import tayara
+
+logger = logging.getLogger(__name__)
+
+EXTRACTORS = {
+    "tayara": tayara.extract,
+}
+
+# Fields the LLM extraction is mostly needed for
+KEY_FIELDS = ["title", "price", "rooms", "area_m2", "governorate"]
+
+# Skip LLM extraction when the DOM already covers this share of KEY_FIELDS
+LLM_SKIP_COVERAGE = 0.8
+
+
+def extract_fields(source: str, html: str) -> dict:
+    """Fields found in the page's DOM (None values dropped); {} for unknown sources."""
+    extractor = EXTRACTORS.get(source)
+    if extractor is None or not html:
+        return {}
+    try:
+        fields = extractor(html)
+    except Exception as e:
+        logger.warning(f"DOM extraction failed for {source}: {e}")
+        return {}
+    return {k: v for k, v in fields.items() if v is not None}
+
+
+def missing_fields(fields: dict) -> list:
+    return [f for f in KEY_FIELDS if fields.get(f) is None]
+
+
+def needs_llm(fields: dict) -> bool:
+    """True when the DOM left too many key fields empty."""
+    covered = len(KEY_FIELDS) - len(missing_fields(fields))
+    return covered / len(KEY_FIELDS) < LLM_SKIP_COVERAGE
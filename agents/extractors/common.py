@@ -0,0 +1,93 @@
+import re
+import unicodedata
+
+GOVERNORATES = [
+    "Tunis", "Ariana", "Ben Arous", "Manouba", "Nabeul", "Zaghouan", "Bizerte",
+    "Béja", "Jendouba", "Le Kef", "Siliana", "Sousse", "Monastir", "Mahdia",
+    "Sfax", "Kairouan", "Kasserine", "Sidi Bouzid", "Gabès", "Médenine",
+    "Tataouine", "Gafsa", "Tozeur", "Kébili",
+]
+
+# Column limits on Listing: price is DECIMAL(12, 2); counts are IntegerFields.
+# MAX_AREA (m²) keeps absurd surfaces — and float("inf") from a runaway digit
+# string, which jsonb rejects — out of area_m2 and raw_extracted
+MAX_PRICE = 9_999_999_999.99
+MAX_COUNT = 100
+MAX_AREA = 10_000_000
+
+# The first number as displayed on a page: "1,250,000" (comma thousands),
+# "250 000", "1.250.000", "1 500,5" (grouped thousands) or a plain "12.5" /
+# "120". A lone "1,250" could be 1.25 or 1250; it is matched as ambiguous
+# and rejected, since a wrong price is worse than a missing one
+_NUMBER_RE = re.compile(
+    r"(?P<comma_grouped>\d{1,3}(?:,\d{3}){2,}(?![\d,])(?:\.\d+)?)"
+    r"|(?P<ambiguous>\d{1,3},\d{3}(?![\d,]))"
+    r"|(?P<grouped>\d{1,3}(?:[ \u00a0\u202f.]\d{3})+(?!\d)(?:,\d+)?)"
+    r"|\d+(?:[.,]\d+)?"
+)
+_ROOMS_RE = re.compile(r"\bS\s*\+\s*(\d+)", re.IGNORECASE)
+_AREA_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*m(?:²|2)", re.IGNORECASE)
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents: "Gabès" → "gabes"."""
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+_GOVERNORATE_BY_FOLDED = {_fold(g): g for g in GOVERNORATES}
+
+
+def parse_number(text, max_value=None):
+    """
+    Parse the first number in displayed text: "250 000 DT" → 250000.0.
+    Returns None when there is no number, it is ambiguous ("1,250") or it
+    falls outside 0..max_value.
+    """
+    match = _NUMBER_RE.search(text or "")
+    if not match:
+        return None
+    if match.group("ambiguous"):
+        return None
+    token = match.group(0)
+    if match.group("comma_grouped"):
+        token = token.replace(",", "")
+    elif match.group("grouped"):
+        token = re.sub(r"[ \u00a0\u202f.]", "", token)
+    value = float(token.replace(",", "."))
+    if max_value is not None and not 0 <= value <= max_value:
+        return None
+    return value
+
+
+def parse_rooms(text):
+    """
+    Room count from the Tunisian S+N notation: "Appartement S+3" → 3.
+    Returns None when there is no S+N or it falls outside 0..MAX_COUNT.
+    """
+    match = _ROOMS_RE.search(text or "")
+    if not match:
+        return None
+    rooms = int(match.group(1))
+    return rooms if rooms <= MAX_COUNT else None
+
+
+def parse_area(text):
+    """
+    Surface in m²: "120 m²" → 120.0.
+    Returns None when there is no surface or it falls outside 0..MAX_AREA.
+    """
+    match = _AREA_RE.search(text or "")
+    if not match:
+        return None
+    area = float(match.group(1).replace(",", "."))
+    return area if area <= MAX_AREA else None
+
+
+def find_governorate(text):
+    """First Tunisian governorate mentioned in text, in canonical spelling."""
+    folded = _fold(text or "")
+    for key, name in _GOVERNORATE_BY_FOLDED.items():
+        if re.search(rf"\b{re.escape(key)}\b", folded):
+            return name
+    return None
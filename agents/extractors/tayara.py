@@ -0,0 +1,79 @@
+import lxml.html
+
+from agents.extractors.common import (
+    MAX_COUNT,
+    MAX_PRICE,
+    find_governorate,
+    parse_area,
+    parse_number,
+    parse_rooms,
+)
+
+# CSS selectors for a tayara.tn/item/... page, tried in order
+SELECTORS = {
+    "title": ["h1", "meta[property='og:title']"],
+    "price": [".adPrice data[value]", ".adPrice > span"],
+    "location": [".adLocation", "meta[property='og:description']"],
+    "criteria": ["ul li"],
+}
+
+# Criteria label (lowercased prefix) → field
+CRITERIA_FIELDS = {
+    "superficie": "area_m2",
+    "chambres": "bedrooms",
+    "salles de bains": "bathrooms",
+}
+
+
+def _first(doc, field):
+    """Text of the first element matching one of the field's selectors."""
+    for selector in SELECTORS[field]:
+        for el in doc.cssselect(selector):
+            if el.tag == "meta":
+                text = el.get("content", "")
+            elif el.tag == "data":
+                text = el.get("value", "")
+            else:
+                text = el.text_content()
+            text = " ".join(text.split())
+            if text:
+                return text
+    return None
+
+
+def _criteria(doc) -> dict:
+    """Label/value pairs from the listing's criteria list."""
+    fields = {}
+    for selector in SELECTORS["criteria"]:
+        for li in doc.cssselect(selector):
+            spans = [s.text_content().strip() for s in li.cssselect("span")]
+            spans = [s for s in spans if s]
+            if len(spans) < 2:
+                continue
+            label, value = spans[0].lower(), spans[-1]
+            for prefix, field in CRITERIA_FIELDS.items():
+                if label.startswith(prefix) and field not in fields:
+                    fields[field] = value
+    return fields
+
+
+def extract(html: str) -> dict:
+    """Pull the key listing fields out of a Tayara page. Missing fields are None."""
+    doc = lxml.html.fromstring(html)
+
+    title = _first(doc, "title")
+    location = _first(doc, "location")
+    criteria = _criteria(doc)
+
+    bedrooms = parse_number(criteria.get("bedrooms"), max_value=MAX_COUNT)
+    bathrooms = parse_number(criteria.get("bathrooms"), max_value=MAX_COUNT)
+
+    return {
+        "title": title,
+        "price": parse_number(_first(doc, "price"), max_value=MAX_PRICE),
+        "rooms": parse_rooms(title),
+        "bedrooms": int(bedrooms) if bedrooms is not None else None,
+        "bathrooms": int(bathrooms) if bathrooms is not None else None,
+        "area_m2": parse_area(criteria.get("area_m2", "") + " m²") or parse_area(title),
+        "governorate": find_governorate(location),
+    }
@@ -0,0 +1,57 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", "llm_cache.sqlite3")
+
+
+class LLMCache:
+    """
+    Exact-match prompt cache for LLM responses, stored in SQLite.
+
+    Key: sha256(model + prompt). Paginated search pages often produce the
+    same prompt twice, and with temperature=0 the answer won't change —
+    so a hit skips a full Qwen3 inference.
+    """
+
+    def __init__(self, path=LLM_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " response TEXT NOT NULL,"
+            " created_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+        )
+        self._conn.commit()
+        logger.info(f"LLMCache initialized | path={path}")
+
+    @staticmethod
+    def _key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model: str, prompt: str):
+        """Return the cached response, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?",
+                (self._key(model, prompt),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, model: str, prompt: str, response: str):
+        """Store a response. Empty responses (failed calls) are not cached."""
+        if not response:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model, response) VALUES (?, ?, ?)",
+                (self._key(model, prompt), model, response),
+            )
+            self._conn.commit()
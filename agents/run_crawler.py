@@ -1,6 +1,8 @@
+import asyncio
 import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'estate_mind.settings')
@@ -8,9 +10,13 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'estate_mind.settings')
 import django
 django.setup()
 
+from asgiref.sync import sync_to_async
+from django.db import DatabaseError, transaction
 from listings.models import Listing
 from agents.crawler import CrawlerAgent
 from agents.bronze_storage import BronzeStorage
+from agents.crawl_journal import CrawlJournal
+from agents.extractors import missing_fields
 
 logging.basicConfig(
     level=logging.INFO,
@@ -18,46 +24,216 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+BRONZE_UPLOAD_WORKERS = 32
+DB_BATCH_SIZE = 500
 
-def save_to_bronze_and_db(results: list) -> dict:
+STAT_KEYS = (
+    "bronze_saved", "bronze_empty", "bronze_failed",
+    "db_created", "db_skipped", "db_failed",
+)
+
+
+def existing_urls(urls: list) -> set:
+    """The subset of `urls` that already has a Listing row (one SELECT)."""
+    return set(
+        Listing.objects.filter(source_url__in=list(urls))
+        .values_list("source_url", flat=True)
+    )
+
+
+def count_inserted(listings: list) -> int:
+    """
+    How many of `listings` bulk_create actually inserted. Rows dropped by
+    ignore_conflicts still have a source_url in the DB, but with another
+    run's scraped_at — which auto_now_add stamped on our instances.
+    """
+    ours = {(l.source_url, l.scraped_at) for l in listings}
+    rows = Listing.objects.filter(
+        source_url__in=[l.source_url for l in listings]
+    ).values_list("source_url", "scraped_at")
+    return sum(1 for row in rows if row in ours)
+
+
+def insert_listings(listings: list) -> list:
+    """
+    bulk_create `listings`. If the batch hits a DatabaseError (one value the
+    column rejects aborts the whole statement), retry row by row so only
+    the bad rows are lost. Returns the listings that could not be inserted.
+    """
+    try:
+        with transaction.atomic():
+            # source_url is unique, so concurrent runs can't create duplicates
+            Listing.objects.bulk_create(
+                listings, batch_size=DB_BATCH_SIZE, ignore_conflicts=True
+            )
+        return []
+    except DatabaseError as e:
+        logger.warning(f"⚠️ Batch insert of {len(listings)} rows failed, retrying row by row: {e}")
+
+    failed = []
+    for listing in listings:
+        try:
+            with transaction.atomic():
+                Listing.objects.bulk_create([listing], ignore_conflicts=True)
+        except DatabaseError as e:
+            logger.error(f"❌ DB insert failed for {listing.source_url}: {e}")
+            failed.append(listing)
+    return failed
+
+
+def save_to_bronze_and_db(results: list, bronze: BronzeStorage = None) -> tuple:
     """
     Save crawled data following the architecture:
     1. Raw HTML → MinIO (Bronze layer) — immutable audit trail
     2. Listing metadata → PostgreSQL (Django ORM) — Silver layer
+
+    Returns (stats, persisted URLs). A URL counts as persisted once it has
+    a Listing row — rows are only created once their HTML reached Bronze,
+    or when the crawl returned no HTML to store (empty raw_html_key).
     """
-    bronze = BronzeStorage()
-    stats = {"bronze_saved": 0, "db_created": 0, "db_skipped": 0}
+    bronze = bronze or BronzeStorage()
+    stats = dict.fromkeys(STAT_KEYS, 0)
+
+    # Listings already in the DB have their HTML in Bronze too — one SELECT
+    # tells us what to skip for both layers.
+    existing = existing_urls([r["url"] for r in results])
 
+    new_results = {}
     for r in results:
-        url = r["url"]
+        if r["url"] in existing or r["url"] in new_results:
+            stats["db_skipped"] += 1
+        else:
+            new_results[r["url"]] = r
 
-        # === BRONZE: Store raw HTML in MinIO ===
-        minio_key = r.get("raw_html_key", "")
-        raw_html = r.get("raw_html", "")
+    # === BRONZE: Store raw HTML in MinIO ===
+    # Keys are deterministic (date + url hash) and PUT is idempotent, so we
+    # upload in parallel without a HEAD round-trip per object.
+    uploaded, empty = set(), set()
+    for url, r in new_results.items():
+        if not (r.get("raw_html_key") and r.get("raw_html")):
+            empty.add(url)
 
-        if minio_key and raw_html:
-            if not bronze.exists(minio_key):
-                bronze.store_raw_html(minio_key, raw_html)
-                stats["bronze_saved"] += 1
+    with ThreadPoolExecutor(max_workers=BRONZE_UPLOAD_WORKERS) as pool:
+        futures = {
+            pool.submit(bronze.store_raw_html, r["raw_html_key"], r["raw_html"]): url
+            for url, r in new_results.items()
+            if url not in empty
+        }
+        for future in as_completed(futures):
+            try:
+                stored = future.result()
+            except Exception as e:
+                logger.error(f"❌ Bronze upload failed for {futures[future]}: {e}")
+                stored = False
+            if stored:
+                uploaded.add(futures[future])
 
-        # === SILVER: Save listing to Django DB ===
-        if Listing.objects.filter(source_url=url).exists():
-            stats["db_skipped"] += 1
-            continue
+    stats["bronze_saved"] += len(uploaded)
+    stats["bronze_empty"] += len(empty)
+    stats["bronze_failed"] += len(futures) - len(uploaded)
 
-        title = url.split("/")[-2].replace("-", " ").title()[:200]
+    # === SILVER: Save listings to Django DB ===
+    # Skip listings whose upload failed: a row is what marks a URL as done,
+    # so they must be left to be retried next run. Pages crawled without
+    # any HTML still get their row, with no Bronze key.
+    new_listings = []
+    for url, r in new_results.items():
+        if url not in uploaded and url not in empty:
+            continue
+        extracted = r.get("extracted", {})
+        title = extracted.get("title") or url.split("/")[-2].replace("-", " ").title()
+        title = title[:200]
 
-        Listing(
+        new_listings.append(Listing(
             title=title,
             source=r["source"],
             source_url=url,
-            raw_html_key=minio_key,
+            raw_html_key="" if url in empty else r["raw_html_key"],
             description=r.get("markdown", "")[:5000],
+            price=extracted.get("price"),
+            rooms=extracted.get("rooms"),
+            bedrooms=extracted.get("bedrooms"),
+            bathrooms=extracted.get("bathrooms"),
+            area_m2=extracted.get("area_m2"),
+            governorate=extracted.get("governorate", ""),
+            # Tells the LLM extraction stage which rows (and fields) still need it
+            raw_extracted={
+                "dom": extracted,
+                "needs_llm": r.get("needs_llm", True),
+                "missing_fields": missing_fields(extracted),
+            },
             status="raw",
-        ).save()
-        stats["db_created"] += 1
+        ))
+
+    # Rows the DB rejected stay unpersisted, so the next run retries them
+    failed = insert_listings(new_listings)
+    stats["db_failed"] += len(failed)
+    failed_urls = {l.source_url for l in failed}
+    new_listings = [l for l in new_listings if l.source_url not in failed_urls]
+
+    created = count_inserted(new_listings)
+    stats["db_created"] += created
+    stats["db_skipped"] += len(new_listings) - created  # lost a race to another run
+
+    # Rows that lost the race exist too — the other run stored their HTML
+    persisted = existing | {l.source_url for l in new_listings}
+    return stats, persisted
+
+
+async def crawl_and_save(
+    agent: CrawlerAgent,
+    bronze: BronzeStorage,
+    journal: CrawlJournal = None,
+    **run_kwargs,
+) -> tuple:
+    """
+    Stream listings out of the crawler and flush them every DB_BATCH_SIZE
+    rows. Each flush runs in the background while the next batch is being
+    crawled, so at most two batches of raw HTML are held in memory.
+
+    With a journal, URLs are recorded once they are persisted, and a
+    re-run skips anything in the journal or already in the DB — a crashed
+    run resumes where it stopped instead of re-fetching everything.
+    Returns (listings crawled, merged save stats).
+    """
+    save = sync_to_async(save_to_bronze_and_db)
+    find_existing = sync_to_async(existing_urls)
+    stats = dict.fromkeys(STAT_KEYS, 0)
+    crawled = 0
+    batch = []
+    in_flight = None
+
+    async def flush(rows):
+        batch_stats, persisted = await save(rows, bronze)
+        for key, value in batch_stats.items():
+            stats[key] += value
+        if journal is not None:
+            journal.record(persisted)
+
+    async def already_done(urls):
+        done = journal.done(urls) if journal is not None else set()
+        remaining = [u for u in urls if u not in done]
+        return done | await find_existing(remaining)
 
-    return stats
+    try:
+        async for result in agent.run_stream(skip=already_done, **run_kwargs):
+            crawled += 1
+            batch.append(result)
+            if len(batch) >= DB_BATCH_SIZE:
+                if in_flight:
+                    await in_flight
+                in_flight = asyncio.create_task(flush(batch))
+                batch = []
+    finally:
+        # Even if crawling fails, save what was already fetched — the batch
+        # in flight and the partial one — before the error propagates, so
+        # the journal lets the next run resume after them.
+        if in_flight:
+            await in_flight
+        if batch:
+            await flush(batch)
+
+    return crawled, stats
 
 
 def main():
@@ -67,20 +243,23 @@ def main():
     print("=" * 65 + "\n")
 
     agent = CrawlerAgent()
+    bronze = BronzeStorage()
+    journal = CrawlJournal()
 
-    results = agent.run(
+    # Crawl and save to MinIO (Bronze) + PostgreSQL (Silver) as we go
+    crawled, stats = asyncio.run(crawl_and_save(
+        agent,
+        bronze,
+        journal,
         search_url="https://www.tayara.tn/ads/c/Immobilier",
         max_pages=500,
         max_listings=5000,
-    )
-
-    print(f"\n🕷️  Crawled: {len(results)} listings")
+    ))
 
-    # Save to MinIO (Bronze) + PostgreSQL (Silver)
-    stats = save_to_bronze_and_db(results)
+    print(f"\n🕷️  Crawled: {crawled} listings")
 
-    print(f"\n📦 Bronze (MinIO):  {stats['bronze_saved']} raw HTML files stored")
-    print(f"💾 Silver (DB):     {stats['db_created']} new | {stats['db_skipped']} skipped")
+    print(f"\n📦 Bronze (MinIO):  {stats['bronze_saved']} raw HTML files stored | {stats['bronze_empty']} empty | {stats['bronze_failed']} failed")
+    print(f"💾 Silver (DB):     {stats['db_created']} new | {stats['db_skipped']} skipped | {stats['db_failed']} failed")
     print(f"📊 Total in DB:     {Listing.objects.count()}")
 
     print(f"\n👉 Django Admin:  http://localhost:8000/admin/listings/listing/")
@@ -0,0 +1,104 @@
+import os
+import unittest
+
+from agents.extractors import extract_fields, missing_fields, needs_llm, tayara
+from agents.extractors.common import (
+    MAX_PRICE,
+    find_governorate,
+    parse_area,
+    parse_number,
+    parse_rooms,
+)
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class ParseNumberTests(unittest.TestCase):
+    def test_grouped_thousands(self):
+        self.assertEqual(parse_number("250 000 DT"), 250000.0)
+        self.assertEqual(parse_number("250 000 DT"), 250000.0)
+        self.assertEqual(parse_number("1.250.000"), 1250000.0)
+        self.assertEqual(parse_number("1 500,5 DT"), 1500.5)
+
+    def test_comma_thousands(self):
+        self.assertEqual(parse_number("1,250,000 DT"), 1250000.0)
+        self.assertEqual(parse_number("2,500,000.50"), 2500000.5)
+        self.assertIsNone(parse_number("1,250 DT"))
+
+    def test_plain_numbers(self):
+        self.assertEqual(parse_number("120"), 120.0)
+        self.assertEqual(parse_number("12.5"), 12.5)
+        self.assertEqual(parse_number("3,5"), 3.5)
+
+    def test_only_first_number_is_used(self):
+        self.assertEqual(parse_number("S+3 2 salles"), 3.0)
+        self.assertEqual(parse_number("Tél 98 765 432 — 250 000 DT"), 98765432.0)
+
+    def test_no_number(self):
+        self.assertIsNone(parse_number(""))
+        self.assertIsNone(parse_number(None))
+        self.assertIsNone(parse_number("Prix à discuter"))
+
+    def test_out_of_range_is_rejected(self):
+        self.assertIsNone(parse_number("12345678901234", max_value=MAX_PRICE))
+        self.assertEqual(parse_number("450 000", max_value=MAX_PRICE), 450000.0)
+
+    def test_out_of_range_rooms_and_area_are_rejected(self):
+        self.assertIsNone(parse_rooms("Appartement S+12345678901"))
+        self.assertEqual(parse_rooms("Villa S+6"), 6)
+        self.assertIsNone(parse_area("9" * 400 + " m²"))
+        self.assertIsNone(tayara.extract("<h1>Appartement S+12345678901</h1>")["rooms"])
+
+
+class ParseAreaTests(unittest.TestCase):
+    def test_units(self):
+        self.assertEqual(parse_area("120 m²"), 120.0)
+        self.assertEqual(parse_area("Surface: 85,5m2"), 85.5)
+
+    def test_missing(self):
+        self.assertIsNone(parse_area("S+2 Ariana"))
+        self.assertIsNone(parse_area(None))
+
+
+class FindGovernorateTests(unittest.TestCase):
+    def test_accents_and_case_are_ignored(self):
+        self.assertEqual(find_governorate("gabes, Gabès Ville"), "Gabès")
+        self.assertEqual(find_governorate("BEN AROUS, Mégrine"), "Ben Arous")
+
+    def test_whole_words_only(self):
+        self.assertEqual(find_governorate("La Marsa, Tunis"), "Tunis")
+        self.assertIsNone(find_governorate("Tunisie"))
+        self.assertIsNone(find_governorate(None))
+
+
+class TayaraExtractTests(unittest.TestCase):
+    def test_fixture_page(self):
+        fields = tayara.extract(_fixture("tayara_listing.html"))
+
+        self.assertEqual(fields, {
+            "title": "Appartement S+3 à La Marsa",
+            "price": 450000.0,
+            "rooms": 3,
+            "bedrooms": 3,
+            "bathrooms": 2,
+            "area_m2": 145.0,
+            "governorate": "Tunis",
+        })
+
+    def test_price_outside_price_block_is_ignored(self):
+        html = '<h1>Studio</h1><data value="98765432">Tél</data>'
+
+        self.assertIsNone(tayara.extract(html)["price"])
+
+    def test_coverage(self):
+        fields = extract_fields("tayara", _fixture("tayara_listing.html"))
+
+        self.assertEqual(missing_fields(fields), [])
+        self.assertFalse(needs_llm(fields))
+        self.assertTrue(needs_llm(extract_fields("tayara", "<h1>Studio</h1>")))
+        self.assertEqual(extract_fields("mubawab", "<h1>Studio</h1>"), {})
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.11 on 2026-10-15 21:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='listing',
+            index=models.Index(fields=['status', 'source', '-scraped_at'], name='listings_li_status_f33a2d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='listing',
+            index=models.Index(fields=['transaction_type', 'property_type', 'price'], name='listings_li_transac_319a02_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-15 21:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0002_listing_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='listing',
+            name='raw_extracted',
+            field=models.JSONField(blank=True, default=dict, help_text="Raw extraction output: DOM fields ('dom'), whether LLM extraction is still needed ('needs_llm', 'missing_fields')"),
+        ),
+    ]
@@ -77,7 +77,8 @@ class Listing(models.Model):
     )
     raw_extracted = models.JSONField(
         default=dict, blank=True,
-        help_text="Raw LLM extraction output",
+        help_text="Raw extraction output: DOM fields ('dom'), whether LLM "
+                  "extraction is still needed ('needs_llm', 'missing_fields')",
     )
 
     class Meta:
@@ -89,6 +90,9 @@ class Listing(models.Model):
             models.Index(fields=["property_type"]),
             models.Index(fields=["transaction_type"]),
             models.Index(fields=["price"]),
+            # Composite indexes for the usual API filter + ordering combos
+            models.Index(fields=["status", "source", "-scraped_at"]),
+            models.Index(fields=["transaction_type", "property_type", "price"]),
         ]
 
     def __str__(self):
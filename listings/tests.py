@@ -0,0 +1,58 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Listing
+
+
+class ListingPaginationTests(TestCase):
+    """Paging through `next` must return every listing exactly once."""
+
+    TOTAL = 45
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(cls.TOTAL):
+            Listing.objects.create(
+                title=f"Listing {i}",
+                source="tayara",
+                source_url=f"https://www.tayara.tn/item/{i}/",
+                # Half the rows have no price, like freshly crawled ones
+                price=None if i % 2 else 1000 * (i % 7),
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def _collect(self, url):
+        ids, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.json())
+            ids.extend(row["id"] for row in pages[-1]["results"])
+            url = pages[-1]["next"]
+        return ids, pages
+
+    def test_default_order_uses_cursor_and_returns_all_rows(self):
+        ids, pages = self._collect("/api/listings/")
+
+        self.assertEqual(len(ids), self.TOTAL)
+        self.assertEqual(len(set(ids)), self.TOTAL)
+        self.assertNotIn("count", pages[0])
+        self.assertIn("cursor=", pages[0]["next"])
+
+    def test_default_order_is_newest_first(self):
+        ids, _ = self._collect("/api/listings/")
+
+        expected = list(Listing.objects.order_by("-scraped_at").values_list("id", flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_ordering_by_nullable_price_returns_all_rows(self):
+        for ordering in ("price", "-price"):
+            with self.subTest(ordering=ordering):
+                ids, pages = self._collect(f"/api/listings/?ordering={ordering}")
+
+                self.assertEqual(len(ids), self.TOTAL)
+                self.assertEqual(len(set(ids)), self.TOTAL)
+                self.assertEqual(pages[0]["count"], self.TOTAL)
+                self.assertIn("page=2", pages[0]["next"])
@@ -1,15 +1,43 @@
 from rest_framework import viewsets
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Listing
 from .serializers import ListingSerializer, ListingSummarySerializer
 
 
+class ListingCursorPagination(CursorPagination):
+    """Keyset pagination on scraped_at — no OFFSET scans on deep pages."""
+    ordering = '-scraped_at'
+
+
 class ListingViewSet(viewsets.ModelViewSet):
     queryset = Listing.objects.all().order_by('-scraped_at')
+    pagination_class = ListingCursorPagination
     filterset_fields = ['source', 'status', 'governorate', 'rooms']
     search_fields = ['title', 'address', 'description']
     ordering_fields = ['price', 'area_m2', 'scraped_at']
 
+    @property
+    def paginator(self):
+        """
+        Cursor pagination for the default scraped_at order. A cursor built on
+        a nullable, non-unique field (?ordering=price) skips rows, so any
+        explicit ordering falls back to page numbers.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request is not None and self.request.query_params.get('ordering'):
+                self._paginator = PageNumberPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Only load the columns the summary serializer renders
+            queryset = queryset.only(*ListingSummarySerializer.Meta.fields)
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'list':
             return ListingSummarySerializer